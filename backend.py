@@ -32,6 +32,13 @@ class Backend:
                              'balance': lambda d: Balance.from_dict(d['delta']),
                              'execution': lambda d: [Execution.from_dict(e) for e in d['deltas']]}
 
+    @property
+    def first_heartbeat(self) -> asyncio.Event:
+        """
+        Set on the first socket heartbeat after subscribe, covers startup only (not cleared by restart)
+        """
+        return self.__api_ws.first_heartbeat
+
     @Cacher(30)
     async def get_balances(self, skip_empty=True):
         res = await self.api.get_balances()
@@ -81,17 +88,23 @@ class Backend:
 
             log.info(f'Running')
 
-            done, pending = await asyncio.wait([task_ctrl, task_listen], return_when=asyncio.FIRST_COMPLETED)
-            if task_listen in done:  # error in listen task
-                log.error(f'Error in listen task')
-                return
-            else:
-                log.info(f'Ctrl event, stop: {self.__ctrl_stop}')
-                self.__api_ws.stop()
-                await task_listen
-                log.info(f'Listen task stopped')
-                if self.__ctrl_stop:
+            try:
+                done, pending = await asyncio.wait([task_ctrl, task_listen], return_when=asyncio.FIRST_COMPLETED)
+                if task_listen in done:  # error in listen task
+                    log.error(f'Error in listen task')
                     return
+                else:
+                    log.info(f'Ctrl event, stop: {self.__ctrl_stop}')
+                    self.__api_ws.stop()
+                    await task_listen
+                    log.info(f'Listen task stopped')
+                    if self.__ctrl_stop:
+                        return
+            except asyncio.CancelledError:
+                task_ctrl.cancel()
+                task_listen.cancel()
+                await asyncio.gather(task_ctrl, task_listen, return_exceptions=True)
+                raise
 
     def stop(self):
         self.__ctrl_stop = True
@@ -31,23 +31,27 @@ class BittrexSocket:
     def __init__(self, api_key=None, api_secret=None):
         self.api_key = api_key
         self.api_secret = api_secret
+        self.first_heartbeat = asyncio.Event()  # startup only, never cleared on reconnect
 
     async def listen(self, channels: list[str], callbacks: dict[str, Callable]):
         self.__watchdog = Watchdog(HEARTBEAT_TIMEOUT)
         self.__invoke_lock = asyncio.Lock()
         await self.__connect()
-        if self.api_key is not None:
-            await self.__auth()
+        try:
+            if self.api_key is not None:
+                await self.__auth()
 
-        assert 'heartbeat' not in channels
-        channels.append('heartbeat')
-        callbacks['heartbeat'] = self.__on_heartbeat
-        await self.__subscribe(channels, callbacks)
-        await self.__watchdog.loop()
-        self.__connection.close()
+            assert 'heartbeat' not in channels
+            channels.append('heartbeat')
+            callbacks['heartbeat'] = self.__on_heartbeat
+            await self.__subscribe(channels, callbacks)
+            await self.__watchdog.loop()
+        finally:
+            self.__connection.close()
 
     async def __on_heartbeat(self, _):
         self.__watchdog.reset()
+        self.first_heartbeat.set()
 
     async def __connect(self):
         self.__connection = Connection(URL)
@@ -14,6 +14,7 @@ class Cacher:
         self.deflifetime = deflifetime
         self.cache: dict[int, (float, object)] = {}
         self.cache_queue = deque(maxlen=maxlen) if maxlen is not None else None
+        self.inflight: dict[int, asyncio.Future] = {}
 
     def __call__(self, fn):
         def pre_cache(args, kwargs):
@@ -55,15 +56,20 @@ class Cacher:
                 post_cache(key, result)
             return result
 
+        def post_cache_async(key, task: asyncio.Future):
+            del self.inflight[key]
+            if not task.cancelled() and task.exception() is None:
+                post_cache(key, task.result())
+
         async def wrapped_async(*args, **kwargs):
             key, valid, value = pre_cache(args, kwargs)
             log.debug(f'Cache {valid} {fn}')
             if valid:
-                result = value
-            else:
-                result = await fn(*args, **kwargs)
-                post_cache(key, result)
-            return result
+                return value
+            if key not in self.inflight:  # concurrent callers share one call
+                task = self.inflight[key] = asyncio.ensure_future(fn(*args, **kwargs))
+                task.add_done_callback(lambda t: post_cache_async(key, t))
+            return await asyncio.shield(self.inflight[key])
 
         return wrapped_async if asyncio.iscoroutinefunction(fn) else wrapped
 
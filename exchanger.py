@@ -1,24 +1,45 @@
+from __future__ import annotations
+
 import asyncio
 import itertools
 import logging
 import os
 import argparse
+import time
 
 from dataclasses import dataclass
-from typing import Optional
-
-from aiogram import types
-from configobj import ConfigObj
-from pycbrf import ExchangeRates
+from typing import Optional, TYPE_CHECKING
 
-import backend
 import cacher
+import corotools
 import schema
-import tgbot
+
+if TYPE_CHECKING:
+    from aiogram import types
+
+log = logging.getLogger(__name__)
+
+BACKEND_STOP_TIMEOUT = 5
+
+
+def __process_started():
+    """perf_counter() value at process start (from /proc), so interpreter startup and imports are counted"""
+    try:
+        with open('/proc/self/stat') as f:
+            starttime = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return time.perf_counter() - (uptime - starttime / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return time.perf_counter()
+
+
+STARTED = __process_started()
 
 
 def __get_usd_rub_rate(date=None):
     try:
+        from pycbrf import ExchangeRates
         return float(ExchangeRates(on_date=date)['USD'].rate)
     except Exception as e:
         print('ExchangeRates exc')
@@ -74,15 +95,41 @@ def format_summary(c: _SummaryCoin, maxlen):
     return s
 
 
+async def warmup():
+    await asyncio.gather(back.get_balances(), warmup_usd_rub_rate())
+    log.info(f'Cache warmed up {time.perf_counter() - STARTED:.2f}s since process start')
+
+
+async def warmup_usd_rub_rate():
+    await (await get_usd_rub_rate())
+
+
+async def report_startup(name, event: asyncio.Event):
+    await event.wait()
+    elapsed = time.perf_counter() - STARTED
+    log.info(f'{name} {elapsed:.2f}s since process start')
+    await bot.api.send_message(bot.user_id, f'{name} {elapsed:.2f}s since process start')
+
+
 async def main():
-    await bot.api.send_message(bot.user_id, 'Exchanger starting...')
     task_backend = asyncio.create_task(back.run())
     task_tgbot = asyncio.create_task(bot.polling())
+    tasks_aux = [asyncio.create_task(c) for c in (
+        corotools.wraptry(bot.api.send_message, msg='Startup message exception')(bot.user_id, 'Exchanger starting...'),
+        corotools.wraptry(warmup, msg='Cache warmup exception')(),
+        corotools.wraptry(report_startup, msg='Startup report exception')('Updates skipped', bot.updates_skipped),
+        corotools.wraptry(report_startup, msg='Startup report exception')('First heartbeat', back.first_heartbeat))]
     done, pending = await asyncio.wait([task_backend, task_tgbot], return_when=asyncio.FIRST_COMPLETED)
+    for t in tasks_aux:
+        t.cancel()
     if task_tgbot in pending:
         await bot.stop()
     if task_backend in pending:
-        await back.stop()
+        back.stop()
+        try:
+            await asyncio.wait_for(task_backend, BACKEND_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.warning('Backend stop timeout')
 
 
 async def cmd_balance(message: types.Message):
@@ -172,6 +219,12 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     logging.basicConfig(level=args.log_level)
+
+    from configobj import ConfigObj
+
+    import backend
+    import tgbot
+
     config = ConfigObj(args.config)
     back = backend.Backend(config['bx_key'], config['bx_secret'], {},
                            {'balance': on_private, 'order': on_private, 'execution': on_private})
@@ -1,3 +1,4 @@
+import asyncio
 import collections.abc
 import logging
 
@@ -12,16 +13,17 @@ class TGBot:
         self.user_id = user_id
         self.api = Bot(token=self.__token)
         self.__dp = Dispatcher(self.api)
+        self.updates_skipped = asyncio.Event()
         self.__callbacks = callbacks if callbacks is not None else {}
         self.__callbacks['ping'] = self.__on_ping
         self.__dp.register_message_handler(self.__on_command, filters.IDFilter(self.user_id),
                                            commands=self.__callbacks.keys())
 
     async def polling(self):
-        user = await self.api.me
+        user, _ = await asyncio.gather(self.api.me, self.__dp.skip_updates())
         log.info(f"Bot: {user.full_name} [@{user.username}]")
-        await self.__dp.skip_updates()
         log.info(f'Updates were skipped successfully.')
+        self.updates_skipped.set()
         await self.__dp.start_polling()
 
     async def stop(self):